@@ -0,0 +1,45 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+_fastsearch.pyx
+
+Compiled hot loops for fsearch. Build in place with:
+
+    pip install cython
+    cythonize -i _fastsearch.pyx
+
+fsearch.py falls back to its pure-Python versions when this
+extension is not built.
+"""
+
+def filter_names(list names, signed char[:] is_file_flags, object name_match,
+                 object include_re):
+    """
+    Select the directory entries whose names match the search pattern.
+
+    Same contract as fsearch.filter_names: name_match is the bound
+    match/search method of the compiled name pattern, and include_re
+    only applies to regular files. Names may be str or bytes.
+
+    Returns:
+        list: Indices into names of matching entries
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(names)
+    cdef list hits = []
+    cdef object name
+    cdef object include_match = None
+
+    if include_re is not None:
+        include_match = include_re.match
+
+    for i in range(n):
+        name = names[i]
+
+        # Skip files not matching include pattern
+        if is_file_flags[i] and include_match is not None and include_match(name) is None:
+            continue
+
+        if name_match(name) is not None:
+            hits.append(i)
+
+    return hits
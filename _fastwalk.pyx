@@ -0,0 +1,125 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+_fastwalk.pyx
+
+Compiled directory walker for fsearch name searches on POSIX systems.
+Build in place with:
+
+    pip install cython
+    cythonize -i _fastwalk.pyx
+
+fsearch.py falls back to its os.scandir walk when this extension is
+not built (always the case on Windows).
+"""
+
+from posix.stat cimport struct_stat, stat, lstat, S_ISDIR, S_ISREG, S_ISLNK
+
+cdef extern from "<dirent.h>" nogil:
+    ctypedef struct DIR:
+        pass
+    struct dirent:
+        unsigned char d_type
+        char d_name[256]
+    DIR *opendir(const char *name)
+    dirent *readdir(DIR *dirp)
+    int closedir(DIR *dirp)
+    enum:
+        DT_UNKNOWN
+        DT_DIR
+        DT_REG
+        DT_LNK
+
+cdef extern from "<fnmatch.h>" nogil:
+    int fnmatch(const char *pattern, const char *string, int flags)
+    enum:
+        FNM_NOESCAPE
+        FNM_CASEFOLD
+
+def walk(bytes base_dir, bytes pattern, int max_depth, bint case_insensitive=False,
+         bint include_dirs=True):
+    """
+    Walk base_dir depth-first and yield paths whose names match pattern.
+
+    Directories are read with opendir/readdir and names are matched with
+    fnmatch(3), so no DirEntry or str object is created for entries that
+    do not match. Classification follows fsearch.fast_find: symlinks to
+    regular files count as files and symlinked directories are never
+    entered.
+
+    Args:
+        base_dir: Starting directory
+        pattern: Glob matched against whole entry names
+        max_depth: Maximum depth to search (0 = base_dir only)
+        case_insensitive: If True, match is case-insensitive
+        include_dirs: Whether to include directories in results
+
+    Yields:
+        bytes: Matching paths, in the same order as fsearch.fast_find
+    """
+    cdef int flags = FNM_NOESCAPE | (FNM_CASEFOLD if case_insensitive else 0)
+    cdef const char *c_pattern = pattern
+    cdef DIR *d
+    cdef dirent *ent
+    cdef const char *name
+    cdef struct_stat st
+    cdef unsigned char d_type
+    cdef bint is_file, is_dir
+    cdef int depth
+    cdef bytes current, prefix, path
+    cdef list hits, subdirs
+    cdef list stack = [(base_dir, 0)]
+
+    while stack:
+        current, depth = stack.pop()
+        d = opendir(current)
+        if d == NULL:
+            continue
+
+        hits = []
+        subdirs = []
+        prefix = current if current.endswith(b'/') else current + b'/'
+        try:
+            while True:
+                ent = readdir(d)
+                if ent == NULL:
+                    break
+
+                name = ent.d_name
+                if name[0] == b'.' and (name[1] == 0 or (name[1] == b'.' and name[2] == 0)):
+                    continue
+
+                path = None
+                d_type = ent.d_type
+                if d_type == DT_UNKNOWN or d_type == DT_LNK:
+                    # Filesystem did not say, or the link target decides
+                    path = prefix + <bytes>name
+                    if lstat(path, &st) != 0:
+                        is_file = is_dir = False
+                    elif S_ISLNK(st.st_mode):
+                        is_dir = False
+                        is_file = stat(path, &st) == 0 and S_ISREG(st.st_mode)
+                    else:
+                        is_dir = S_ISDIR(st.st_mode)
+                        is_file = S_ISREG(st.st_mode)
+                else:
+                    is_dir = d_type == DT_DIR
+                    is_file = d_type == DT_REG
+
+                if (include_dirs or is_file) and fnmatch(c_pattern, name, flags) == 0:
+                    if path is None:
+                        path = prefix + <bytes>name
+                    hits.append(path)
+
+                if is_dir and depth < max_depth:
+                    if path is None:
+                        path = prefix + <bytes>name
+                    subdirs.append(path)
+        finally:
+            closedir(d)
+
+        for path in hits:
+            yield path
+
+        # Reversed so subdirectories are popped in listing order
+        for path in reversed(subdirs):
+            stack.append((path, depth + 1))
@@ -8,15 +8,15 @@
 
 import os
 import sys
-HAS_CTRACEBACK=False
-try:
-    import ctraceback
-    HAS_CTRACEBACK=True
-except:
-    pass
+import importlib.util
 import traceback
 import logging
 
+# Optional packages are only probed here; they are imported on first use
+HAS_CTRACEBACK = importlib.util.find_spec('ctraceback') is not None
+HAS_RICH = importlib.util.find_spec('rich') is not None
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
 # Debug mode setup
 DEBUG_MODE = len(sys.argv) > 1 and any('--debug' == arg for arg in sys.argv)
 if DEBUG_MODE:
@@ -28,7 +28,7 @@ if DEBUG_MODE:
     os.environ["LOGGING"] = "1"
     try:
         from pydebugger.debug import debug
-    except:
+    except ImportError:
         print("install pydebugger first ! (pip install 'pydebugger')")
         sys.exit(1)
 else:
@@ -36,52 +36,122 @@ else:
 
 tprint = None  # type: ignore
 
-try:
-    from richcolorlog import setup_logging, print_exception as tpring  # type: ignore
-    logger = setup_logging('fsearch')
-except:
-    import logging
-
+if DEBUG_MODE:
     try:
-        from .custom_logging import get_logger  # type: ignore
+        from richcolorlog import setup_logging, print_exception as tpring  # type: ignore
+        logger = setup_logging('fsearch')
     except ImportError:
-        from custom_logging import get_logger  # type: ignore
-        
-    logger = get_logger('fsearch', level=logging.INFO)
+        try:
+            from .custom_logging import get_logger  # type: ignore
+        except ImportError:
+            from custom_logging import get_logger  # type: ignore
+            
+        logger = get_logger('fsearch', level=logging.INFO)
+else:
+    # Every warning is DEBUG_MODE-gated, a plain logger is enough
+    logger = logging.getLogger('fsearch')
+    logger.addHandler(logging.NullHandler())
 
 if not tprint:
     def tprint(*args, **kwargs):
         traceback.print_exc(*args, **kwargs)
 
-console = None
+_console = None
+
+def _get_console():
+    """Create the output console on first use and cache it."""
+    global _console
+    if _console is None:
+        if HAS_RICH:
+            from rich.console import Console
+        else:
+            from make_colors import Console  # type: ignore
+        _console = Console()
+    return _console
+
+class _LazyConsole:
+    """Module-level console that defers its import until first use."""
+    
+    def __getattr__(self, name):
+        return getattr(_get_console(), name)
+
+console = _LazyConsole()
+
+def _excepthook(*exc_info):
+    """Load ctraceback only when an uncaught exception is reported."""
+    import ctraceback  # type: ignore
+    ctraceback.CTraceback(*exc_info)
 
 # import signal
 if HAS_CTRACEBACK:
-    sys.excepthook = ctraceback.CTraceback  # type: ignore
-    from ctraceback.custom_traceback import console
-# from rich import print
-try:
-    from rich.console import Console
-    HAS_RICH = True
-    console = console or Console()
-except:
-    HAS_RICH = False
+    sys.excepthook = _excepthook
 
-import argparse
-try:
-    from licface import CustomRichHelpFormatter
-except ImportError:
-    CustomRichHelpFormatter = argparse.RawTextHelpFormatter
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 import fnmatch
+import functools
+import mmap
+import re
+import threading
+import time
+from array import array
+from collections import deque
 from pathlib import Path
 # import shutil
-from make_colors import make_colors, Console  # type: ignore
-console = console or Console()
+
+try:
+    import hyperscan  # type: ignore
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    # Compiled name filter, build with: cythonize -i _fastsearch.pyx
+    from _fastsearch import filter_names as filter_names_ext  # type: ignore
+    HAS_FASTSEARCH = True
+except ImportError:
+    HAS_FASTSEARCH = False
+
+try:
+    # Compiled POSIX walker, build with: cythonize -i _fastwalk.pyx
+    from _fastwalk import walk as walk_ext  # type: ignore
+    HAS_FASTWALK = True
+except ImportError:
+    HAS_FASTWALK = False
+
+# Hyperscan databases carry their own scratch space, so keep one per thread
+_hyperscan_local = threading.local()
 
 # Constants
 DEFAULT_CHECK_BYTES = 1024
 MAX_LINE_LENGTH = 10000  # Prevent memory issues with very long lines
+NUMPY_MIN_HITS = 1000  # Hits per file before line lookup switches to numpy
+CASELESS_CHUNK_BYTES = 256 * 1024  # Bytes lowered at a time when pre-checking a file
+PARALLEL_MIN_SUBDIRS = 4  # Subdirectories needed before a walk goes to the thread pool
+CONTENT_BATCH_FILES = 32  # Files searched per thread-pool task
+OUTPUT_BATCH_LINES = 500  # Result lines buffered per console write
+OUTPUT_FLUSH_INTERVAL = 0.2  # Seconds before buffered results are written anyway
+
+# Styles of the parts of a result line
+STYLE_INDEX = 'bold #FFAAFF'
+STYLE_PATH = 'bold #FFFF00'
+STYLE_LINE_NUM = 'white on red'
+STYLE_LINE = 'bright_cyan'
+
+# Extensions whose text/binary nature is known without reading the file
+_TEXT_EXT = frozenset({
+    '.py', '.txt', '.md', '.c', '.h', '.rs', '.go', '.js', '.json', '.yaml',
+    '.toml', '.html', '.css', '.log', '.cfg', '.ini',
+})
+_BIN_EXT = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.zip', '.gz', '.tar', '.xz', '.7z',
+    '.exe', '.dll', '.so', '.dylib', '.pdf', '.mp3', '.mp4', '.webp', '.ico',
+    '.pyc', '.class',
+})
+
+# Bytes that may appear in text, as in file(1): printable ASCII, common
+# control characters and everything >= 0x80 (UTF-8, Latin-1, ...)
+_TEXT_CHARS = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
 
 
 class SearchError(Exception):
@@ -89,96 +159,300 @@ class SearchError(Exception):
     pass
 
 
-def is_binary_file(file_path, num_bytes=DEFAULT_CHECK_BYTES):
+def _is_binary_chunk(chunk):
+    """Return True if a leading chunk of file data looks binary."""
+    if b'\0' in chunk:
+        return True
+    # Anything left after deleting text bytes is a non-text control byte
+    return bool(chunk.translate(None, _TEXT_CHARS))
+
+def _binary_by_extension(file_path):
     """
-    Check if a file is binary by reading the first num_bytes.
+    Classify a file as binary or text from its extension alone.
+    
+    Returns:
+        bool: True for known binary, False for known text, None if unknown
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in _TEXT_EXT:
+        return False
+    if ext in _BIN_EXT:
+        return True
+    return None
+
+def _map_file(file_path, num_bytes=DEFAULT_CHECK_BYTES):
+    """
+    Classify a file as binary or text and memory-map it if it is text.
+    
+    This is the one place that decides what is binary: known extensions
+    are trusted without opening the file, anything else has its first
+    num_bytes probed through the map, so no separate read is needed.
     
     Args:
         file_path: Path to file
         num_bytes: Number of bytes to check
         
     Returns:
-        bool: True if binary, False if text
+        tuple: (is_binary, mm) where mm is a read-only mmap of a non-empty
+               text file, otherwise None; unreadable files count as binary
     """
+    is_binary = _binary_by_extension(file_path)
+    if is_binary:
+        return True, None
+    
     try:
-        with open(file_path, 'rb') as f:
-            chunk = f.read(num_bytes)
-            if b'\0' in chunk:
-                return True
-            # Attempt decoding as text to catch unusual characters
-            try:
-                chunk.decode('utf-8')
-                return False
-            except UnicodeDecodeError:
-                return True
-    except (IOError, OSError) as e:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError as e:
         if DEBUG_MODE:
             logger.warning(f"Could not read file: {file_path} - {e}")
-        return True
+        return True, None
+    
+    try:
+        if not os.fstat(fd).st_size:
+            return False, None
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        if DEBUG_MODE:
+            logger.warning(f"Could not map file: {file_path} - {e}")
+        return True, None
+    finally:
+        # The map holds its own reference to the file
+        os.close(fd)
+    
+    # Known text extensions skip the head probe
+    if is_binary is None and _is_binary_chunk(mm[:num_bytes]):
+        mm.close()
+        return True, None
+    return False, mm
+
+def is_binary_file(file_path, num_bytes=DEFAULT_CHECK_BYTES):
+    """
+    Check if a file is binary by reading the first num_bytes.
+    
+    Args:
+        file_path: Path to file
+        num_bytes: Number of bytes to check
+        
+    Returns:
+        bool: True if binary or unreadable, False if text
+    """
+    is_binary, mm = _map_file(file_path, num_bytes)
+    if mm is not None:
+        mm.close()
+    return is_binary
 
 def open_file_safely(file_path):
-    if not is_binary_file(file_path):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.readlines()
-                # console.print("File content:", content)
-                return content
-        except:
-            pass
-    # else:
-    #     console.print(f"[bold FF00FF]Skipping binary file:[/] [bold #FFFF00]{file_path}[/]")
+    """
+    Read a text file as raw bytes.
+    
+    Decoding is left to the caller so it can be limited to the parts
+    that are actually shown.
+    
+    Args:
+        file_path: Path to file
+        
+    Returns:
+        bytes: File content, or None for binary or unreadable files
+    """
+    is_binary, mm = _map_file(file_path)
+    if mm is None:
+        return None if is_binary else b''
+    with mm:
+        return mm[:]
 
 def read_file_lines(file_path, max_line_length=MAX_LINE_LENGTH):
     """
-    Safely read text file lines with memory protection.
+    Safely stream text file lines with memory protection.
+    
+    Lines are decoded one at a time from the mapped file, so no list of
+    the whole file is ever built.
     
     Args:
         file_path: Path to file
         max_line_length: Maximum line length to prevent memory issues
         
+    Yields:
+        tuple: (line_number, line_content), line numbers start at 0;
+               nothing for binary or unreadable files
+    """
+    _, mm = _map_file(file_path)
+    if mm is None:
+        return
+    
+    with mm:
+        for line_num, raw in enumerate(iter(mm.readline, b'')):
+            if len(raw) > max_line_length:
+                if DEBUG_MODE:
+                    logger.warning(f"Line {line_num + 1} too long in {file_path}, skipping")
+                continue
+            if raw.endswith(b'\r\n'):
+                raw = raw[:-2] + b'\n'
+            yield line_num, raw.decode('utf-8', errors='ignore')
+
+def _find_offsets(buf, needle):
+    """Yield the offset of the first needle hit on each line of buf."""
+    size = len(buf)
+    pos = buf.find(needle)
+    while 0 <= pos < size:
+        yield pos
+        # Continue after the newline ending this line
+        end = buf.find(b'\n', pos)
+        if end == -1:
+            break
+        pos = buf.find(needle, end + 1)
+
+def _contains_caseless(buf, needle):
+    """
+    Check whether a lowercase needle occurs in buf, ignoring ASCII case.
+    
+    buf is lowered one cache-sized chunk at a time, so a file without a
+    hit is rejected without building a lowered copy of all of it.
+    """
+    step = CASELESS_CHUNK_BYTES
+    overlap = len(needle) - 1
+    for start in range(0, len(buf), step):
+        if needle in buf[start:start + step + overlap].lower():
+            return True
+    return False
+
+def _hyperscan_db(needle, case_insensitive):
+    """Return this thread's Hyperscan database for a literal needle."""
+    databases = _hyperscan_local.__dict__.setdefault('databases', {})
+    key = (needle, case_insensitive)
+    db = databases.get(key)
+    if db is None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[re.escape(needle)],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_CASELESS if case_insensitive else 0],
+        )
+        databases[key] = db
+    return db
+
+def _hyperscan_offsets(buf, needle, case_insensitive):
+    """Return start offsets of every needle hit in buf using Hyperscan."""
+    offsets = []
+    
+    def on_match(match_id, start, end, flags, context):
+        offsets.append(end - len(needle))
+    
+    _hyperscan_db(needle, case_insensitive).scan(buf, match_event_handler=on_match)
+    return offsets
+
+def _locate_lines(buf, offsets):
+    """
+    Map sorted hit offsets to the lines containing them.
+    
+    Yields:
+        tuple: (line_number, line_start, line_end) once per line, line
+               numbers start at 0
+    """
+    size = len(buf)
+    line_num = 0
+    last = 0
+    end = -1
+    for pos in offsets:
+        if pos <= end:
+            # Line already reported
+            continue
+        
+        # Running newline count keeps line numbering O(file size)
+        line_num += buf[last:pos].count(b'\n')
+        last = pos
+        
+        start = buf.rfind(b'\n', 0, pos) + 1
+        end = buf.find(b'\n', pos)
+        if end == -1:
+            end = size
+        yield line_num, start, end
+
+def _locate_lines_numpy(buf, offsets):
+    """
+    Vectorized _locate_lines() for files with many hits.
+    
+    All newline positions are found in one pass and each offset is
+    assigned to its line with a single searchsorted call.
+    
     Returns:
-        list: List of lines or empty list if failed
+        iterator: (line_number, line_start, line_end) once per line
     """
-    if is_binary_file(file_path):
-        return []
+    import numpy as np
     
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = []
-            for line_num, line in enumerate(f, 1):
-                if len(line) > max_line_length:
-                    if DEBUG_MODE:
-                        logger.warning(f"Line {line_num} too long in {file_path}, skipping")
-                    continue
-                lines.append(line)
-            return lines
-    except (IOError, OSError, UnicodeDecodeError) as e:
-        if DEBUG_MODE:
-            logger.warning(f"Error reading file {file_path}: {e}")
-        return []
+    newlines = np.flatnonzero(np.frombuffer(buf, dtype=np.uint8) == 10)
+    # bounds[k] + 1 .. bounds[k + 1] is line k
+    bounds = np.concatenate(([-1], newlines, [len(buf)]))
+    line_ids = np.unique(np.searchsorted(newlines, np.asarray(offsets)))
+    starts = bounds[line_ids] + 1
+    ends = bounds[line_ids + 1]
+    return zip(line_ids.tolist(), starts.tolist(), ends.tolist())
 
-def search_in_file(pattern, file_path):
+def search_in_file(pattern, file_path, max_line_length=MAX_LINE_LENGTH,
+                   case_insensitive=False):
     """
     Search for pattern in file and return matching lines with line numbers.
     
+    The file is memory-mapped and scanned as a whole, with Hyperscan when
+    available and bytes.find otherwise; line numbers and line text are
+    only computed for hits.
+    
+    Case-insensitive search lowers the pattern with str.lower(), but the
+    file is only case-folded for ASCII: "CAFÉ" finds "café", but "café"
+    does not find "CAFÉ".
+    
     Args:
         pattern: Text pattern to search for
         file_path: Path to file
+        max_line_length: Matching lines longer than this are skipped
+        case_insensitive: If True, match is case-insensitive (see above)
         
     Returns:
         list: List of tuples (line_number, line_content) or empty list
     """
-    content = read_file_lines(file_path)
-    if not content:
+    _, mm = _map_file(file_path)
+    if mm is None:
         return []
     
+    # Undecodable argv bytes come back as their raw bytes, not as b''.
+    # Lowering the str first folds non-ASCII letters of the pattern too
+    needle = os.fsencode(pattern.lower() if case_insensitive else pattern)
+    matches = []
+    
     try:
-        matches = [(i, line) for i, line in enumerate(content) if pattern in line]
-        return matches
-    except Exception as e:
+        with mm:
+            if HAS_HYPERSCAN and needle:
+                offsets = _hyperscan_offsets(mm, needle, case_insensitive)
+            elif case_insensitive:
+                needle = needle.lower()  # No-op unless undecodable bytes remain
+                if len(mm) > CASELESS_CHUNK_BYTES and not _contains_caseless(mm, needle):
+                    return []
+                # bytes.lower() keeps offsets aligned with the original
+                offsets = _find_offsets(mm[:].lower(), needle)
+            elif mm.find(needle) < 0:
+                # Most files have no hit; skip the generator setup
+                return []
+            else:
+                offsets = _find_offsets(mm, needle)
+            
+            offsets = list(offsets)
+            if HAS_NUMPY and len(offsets) >= NUMPY_MIN_HITS:
+                lines = _locate_lines_numpy(mm, offsets)
+            else:
+                lines = _locate_lines(mm, offsets)
+            
+            for line_num, start, end in lines:
+                if end - start > max_line_length:
+                    if DEBUG_MODE:
+                        logger.warning(f"Line {line_num + 1} too long in {file_path}, skipping")
+                else:
+                    matches.append((line_num, mm[start:end].decode('utf-8', errors='ignore')))
+    except (IOError, OSError, ValueError) as e:
         if DEBUG_MODE:
-            logger.error(f"Error searching in {file_path}: {e}")
+            logger.warning(f"Error searching in {file_path}: {e}")
         return []
+    
+    return matches
 
 def parse_include_patterns(include_pattern, case_insensitive=False):
     """
@@ -200,27 +474,119 @@ def parse_include_patterns(include_pattern, case_insensitive=False):
     
     return patterns
 
-def matches_include_pattern(filename, include_patterns, case_insensitive=False):
+class _SuffixMatcher:
+    """Regex stand-in for include globs that are all of the form '*suffix'."""
+    
+    __slots__ = ('suffixes', 'case_insensitive')
+    
+    def __init__(self, suffixes, case_insensitive):
+        self.suffixes = suffixes
+        self.case_insensitive = case_insensitive
+    
+    def match(self, filename):
+        if self.case_insensitive:
+            filename = filename.lower()
+        return True if filename.endswith(self.suffixes) else None
+
+def compile_include_patterns(include_patterns, case_insensitive=False):
+    """
+    Compile include patterns into a single matcher.
+    
+    Patterns like "*.py" are checked with str.endswith(); anything else
+    becomes one regular expression.
+    
+    Args:
+        include_patterns: List of patterns from parse_include_patterns()
+        case_insensitive: Whether matching is case-insensitive
+        
+    Returns:
+        Object with a re-style match(filename) method, or None if no
+        patterns were given
+    """
+    if not include_patterns:
+        return None
+    
+    return _compile_include_matcher(tuple(include_patterns), case_insensitive)
+
+@functools.lru_cache(maxsize=64)
+def _compile_include_matcher(include_patterns, case_insensitive):
+    """Translate and compile a tuple of include globs (memoized)."""
+    if all(p[:1] == '*' and not any(c in p[1:] for c in '*?[') for p in include_patterns):
+        # parse_include_patterns() already lowered them if case-insensitive
+        return _SuffixMatcher(tuple(p[1:] for p in include_patterns), case_insensitive)
+    
+    flags = re.IGNORECASE if case_insensitive else 0
+    return re.compile(
+        '|'.join(f'(?:{fnmatch.translate(p)})' for p in include_patterns),
+        flags
+    )
+
+def matches_include_pattern(filename, include_re):
     """
     Check if filename matches any include pattern.
     
     Args:
         filename: Name of file to check
-        include_patterns: List of patterns to match
-        case_insensitive: Whether matching is case-insensitive
+        include_re: Matcher from compile_include_patterns() or None
         
     Returns:
         bool: True if matches or no patterns specified
     """
-    if not include_patterns:
+    if include_re is None:
         return True
     
-    fname = filename.lower() if case_insensitive else filename
-    return any(fnmatch.fnmatch(fname, pattern) for pattern in include_patterns)
+    return include_re.match(filename) is not None
+
+@functools.lru_cache(maxsize=256)
+def compile_name_pattern(pattern, is_wildcard, case_insensitive=False):
+    """
+    Compile the search pattern into a name matcher (memoized).
+    
+    Case-insensitivity is handled by the regex, not by lowercasing names.
+    
+    Args:
+        pattern: Pattern to match (str, or bytes for a literal)
+        is_wildcard: Whether pattern is a glob
+        case_insensitive: If True, match is case-insensitive
+        
+    Returns:
+        callable: Bound match (glob) or search (literal) method; returns
+                  None for names that do not match
+    """
+    flags = re.IGNORECASE if case_insensitive else 0
+    if is_wildcard:
+        return re.compile(fnmatch.translate(pattern), flags).match
+    return re.compile(re.escape(pattern), flags).search
+
+def filter_names(names, is_file_flags, name_match, include_re):
+    """
+    Select the directory entries whose names match the search pattern.
+    
+    Pure-Python version of _fastsearch.filter_names, used when the
+    compiled extension is not built.
+    
+    Args:
+        names: Entry names of one directory (str, or bytes for literal searches)
+        is_file_flags: Sequence of 0/1 flags, 1 for regular files
+        name_match: Bound match/search method of the compiled name pattern
+        include_re: Matcher from compile_include_patterns() or None
+        
+    Returns:
+        list: Indices into names of matching entries
+    """
+    hits = []
+    for i, name in enumerate(names):
+        # Skip files not matching include pattern
+        if is_file_flags[i] and include_re is not None and include_re.match(name) is None:
+            continue
+        
+        if name_match(name) is not None:
+            hits.append(i)
+    return hits
 
 def fast_find(base_dir, pattern, max_depth, include_dirs=True, 
               case_insensitive=False, search_in_files=False, 
-              include_pattern='', verbose=False):
+              include_pattern='', verbose=False, workers=1):
     """
     Fast search for files or directories matching a pattern.
     
@@ -232,11 +598,14 @@ def fast_find(base_dir, pattern, max_depth, include_dirs=True,
         case_insensitive: If True, match is case-insensitive
         search_in_files: If True, search for pattern inside files
         include_pattern: Only include files matching this pattern (e.g., "*.py,*.txt")
+        workers: Number of threads scanning directories (0 = automatic);
+                 threads are only used below directories with more than
+                 PARALLEL_MIN_SUBDIRS subdirectories
         
     Returns:
-        list: List of matches. Format depends on search_in_files:
-              - False: ['path1', 'path2', ...]
-              - True: [['path1', [(line_num, line_text), ...]], ...]
+        generator: Matches as they are found. Format depends on search_in_files:
+              - False: 'path'
+              - True: ['path', [(line_num, line_text), ...]]
     """
     # Validate inputs
     if not os.path.exists(base_dir):
@@ -248,105 +617,283 @@ def fast_find(base_dir, pattern, max_depth, include_dirs=True,
     if max_depth < 0:
         raise SearchError(f"max_depth must be >= 0, got: {max_depth}")
     
+    if workers < 0:
+        raise SearchError(f"workers must be >= 0, got: {workers}")
+    
     # Parse include patterns
     include_patterns = parse_include_patterns(include_pattern, case_insensitive)
     if include_patterns:
         console.print(f"[bold cyan]Include patterns:[/] {include_patterns}")
+    include_re = compile_include_patterns(include_patterns, case_insensitive)
     
     # Setup
-    matches = []
     is_wildcard = '*' in pattern or '?' in pattern
     # console.print(f"is_wildcard: {is_wildcard}")
     logger.debug(f"case_insensitive: {case_insensitive}")
+    content_pattern = pattern.replace('*', '')
+    # Scanning is syscall-bound, so allow more threads than CPUs
+    workers = workers or min(32, (os.cpu_count() or 1) * 4)
+    
+    name_match = compile_name_pattern(pattern, is_wildcard, case_insensitive)
+    
+    # Literal name searches compare the raw bytes from readdir and decode
+    # only the hits. Globs, include filters and content search need str
+    # names, and bytes IGNORECASE only folds ASCII.
+    use_bytes = (
+        not is_wildcard and not search_in_files and include_re is None
+        and (not case_insensitive or pattern.isascii())
+    )
+    root = base_dir
+    if use_bytes:
+        root = os.fsencode(base_dir)
+        name_match = compile_name_pattern(os.fsencode(pattern), False, case_insensitive)
+    
+    # Single-threaded name searches can run entirely in the compiled
+    # walker, which matches with fnmatch(3) instead of the regex. Bracket
+    # expressions in globs stay on the regex: fnmatch(3) reads [^...] as
+    # a negated set, fnmatch.translate() takes the ^ literally
+    use_walk_ext = (
+        HAS_FASTWALK and workers == 1 and not search_in_files and include_re is None
+        and (not case_insensitive or pattern.isascii())
+        and not (is_wildcard and '[' in pattern)
+    )
+    
+    # Local aliases for the per-entry loop
+    _filter = filter_names_ext if HAS_FASTSEARCH else filter_names
+    include_match = include_re.match if include_re is not None else None
+    _search_in_file = search_in_file
+    _fsdecode = os.fsdecode
     
     if search_in_files:
         include_dirs = False
     logger.debug(f"include_dirs: {include_dirs}")
     
-    def search(current_dir, current_depth, status = None):
-        """Recursive search function"""
+    def scan(current_dir):
+        """
+        Scan a single directory.
+        
+        Returns:
+            tuple: (name matches, files to search in, subdirectories)
+        """
+        hits = []
+        candidates = []
+        subdirs = []
+        
+        try:
+            with os.scandir(current_dir) as it:
+                entries = list(it)
+        except (OSError, PermissionError) as e:
+            if DEBUG_MODE:
+                logger.warning(f"Error accessing directory {current_dir}: {e}")
+            return hits, candidates, subdirs
+        
+        is_file_flags = array('b')
+        add_flag = is_file_flags.append
+        add_subdir = subdirs.append
+        for entry in entries:
+            # DirEntry caches the type, so only a vanished entry raises here
+            try:
+                is_file = entry.is_file()
+                is_dir = not is_file and entry.is_dir(follow_symlinks=False)
+            except OSError as e:
+                if DEBUG_MODE:
+                    logger.warning(f"Error accessing {entry.path}: {e}")
+                is_file = is_dir = False
+            
+            add_flag(is_file)
+            if is_dir:
+                add_subdir(entry.path)
+        
+        if search_in_files:
+            # Every included file is searched, whatever its name
+            candidates = [
+                entry.path for entry, is_file in zip(entries, is_file_flags)
+                if is_file and (include_match is None or include_match(entry.name) is not None)
+            ]
+        else:
+            names = [entry.name for entry in entries]
+            for i in _filter(names, is_file_flags, name_match, include_re):
+                if include_dirs or is_file_flags[i]:
+                    hits.append(_fsdecode(entries[i].path))
+        
+        return hits, candidates, subdirs
+    
+    def search(status=None):
+        """Depth-first walk driven by an explicit stack"""
+        stack = deque([(root, 0)])
+        while stack:
+            current_dir, current_depth = stack.pop()
+            
+            if status:
+                status.update(f"[bold green]Searching in:[/] [bold #FFFF00]{_fsdecode(current_dir)}[/]")
+            
+            hits, candidates, subdirs = scan(current_dir)
+            yield from hits
+            for path in candidates:
+                found_lines = _search_in_file(
+                    content_pattern, path, case_insensitive=case_insensitive
+                )
+                if found_lines:
+                    yield [path, found_lines]
+            
+            # Reversed so subdirectories are popped in listing order
+            if current_depth < max_depth:
+                stack.extend((path, current_depth + 1) for path in reversed(subdirs))
+                
+                # Hand the remaining subtrees to the pool once the tree is
+                # wide enough to pay for the threads
+                if workers > 1 and len(subdirs) > PARALLEL_MIN_SUBDIRS:
+                    yield from search_parallel(stack, status)
+                    return
+    
+    def search_files(paths):
+        """Search a batch of files, collecting hits in a local list"""
+        found = []
+        for path in paths:
+            found_lines = _search_in_file(
+                content_pattern, path, case_insensitive=case_insensitive
+            )
+            if found_lines:
+                found.append([path, found_lines])
+        return found
+    
+    def scan_dirs(jobs):
+        """Scan a batch of (directory, depth) jobs in one pool task"""
+        hits = []
+        candidates = []
+        next_jobs = []
+        for path, depth in jobs:
+            dir_hits, dir_candidates, subdirs = scan(path)
+            hits += dir_hits
+            candidates += dir_candidates
+            if depth < max_depth:
+                next_jobs.extend((subdir, depth + 1) for subdir in subdirs)
+        return hits, candidates, next_jobs
+    
+    def search_parallel(pending_dirs, status=None):
+        """Scan directories concurrently, yielding results as tasks finish"""
+        with ThreadPoolExecutor(max_workers=workers) as dir_pool, \
+                ThreadPoolExecutor(max_workers=workers) as file_pool:
+            pending = set()
+            file_jobs = set()
+            batch = []
+            
+            def submit_dirs(jobs):
+                # About one task per worker, however many directories
+                # a level has, so futures stay off the per-directory path
+                size = -(-len(jobs) // workers)
+                pending.update(
+                    dir_pool.submit(scan_dirs, jobs[i:i + size])
+                    for i in range(0, len(jobs), size)
+                )
+            
+            def submit_files(final=False):
+                # Candidates from several directories fill one batch, so a
+                # tree of small directories does not become a task per file
+                while len(batch) >= CONTENT_BATCH_FILES or (final and batch):
+                    file_jobs.add(file_pool.submit(search_files, batch[:CONTENT_BATCH_FILES]))
+                    del batch[:CONTENT_BATCH_FILES]
+            
+            submit_dirs(list(pending_dirs))
+            while pending or file_jobs:
+                done, _ = wait(pending | file_jobs, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in file_jobs:
+                        file_jobs.discard(future)
+                        yield from future.result()
+                        continue
+                    
+                    pending.discard(future)
+                    hits, candidates, next_jobs = future.result()
+                    yield from hits
+                    batch += candidates
+                    if next_jobs:
+                        if status:
+                            status.update(f"[bold green]Searching in:[/] [bold #FFFF00]{_fsdecode(next_jobs[0][0])}[/]")
+                        submit_dirs(next_jobs)
+                
+                # The walk is done once no directory task is left
+                submit_files(final=not pending)
+    
+    def search_ext(status=None):
+        """Walk in the compiled extension, decoding only the hits"""
+        # A literal matches anywhere in the name; '[' would open a class
+        glob = pattern if is_wildcard else '*' + pattern.replace('[', '[[]') + '*'
+        for path in walk_ext(os.fsencode(base_dir), os.fsencode(glob), max_depth,
+                             case_insensitive, include_dirs):
+            yield _fsdecode(path)
+    
+    def run():
+        search_func = search_ext if use_walk_ext else search
+        if HAS_RICH and verbose:
+            with console.status(f"[bold green]Searching in:[/] [bold #FFFF00]{base_dir}[/]", spinner="point") as status:  # type: ignore
+                yield from search_func(status)
+        else:
+            yield from search_func()
+    
+    # Inputs are validated above; the walk itself runs as results are consumed
+    return run()
+
+def _iter_entries(base_dir, max_depth):
+    """
+    Yield directory entries below base_dir using os.scandir.
+    
+    Entries directly inside base_dir are at depth 1; directories at
+    max_depth are yielded but never opened.
+    
+    Args:
+        base_dir: Starting directory
+        max_depth: Maximum entry depth to yield
+        
+    Yields:
+        tuple: (os.DirEntry, is_dir) in depth-first order; is_dir does
+               not follow symlinks
+    """
+    stack = deque([(base_dir, 1)])
+    while stack:
+        current_dir, current_depth = stack.pop()
         if current_depth > max_depth:
-            return
+            continue
         
+        subdirs = []
         try:
             with os.scandir(current_dir) as entries:
                 for entry in entries:
-                    if status:
-                        status.update(f"[bold green]Searching in:[/] [bold #FFFF00]{entry.path}[/]")
                     try:
-                        # Skip files not matching include pattern
-                        if entry.is_file() and not matches_include_pattern(
-                            entry.name, include_patterns, case_insensitive
-                        ):
-                            continue
-                        
-                        # Normalize for case-insensitive matching
-                        entry_name = entry.name.lower() if case_insensitive else entry.name
-                        match_pattern = pattern.lower() if case_insensitive else pattern
-                        
-                        # Check if entry matches pattern
-                        is_match = False
-                        if is_wildcard:
-                            is_match = fnmatch.fnmatch(entry_name, match_pattern)
-                        else:
-                            is_match = match_pattern in entry_name
-                        
-                        # Process matches
-                        if is_match and (include_dirs or entry.is_file()):
-                            if search_in_files and entry.is_file():
-                                found_lines = search_in_file(
-                                    match_pattern.replace('*', ''), 
-                                    entry.path
-                                )
-                                if found_lines:
-                                    matches.append([entry.path, found_lines])
-                            else:
-                                matches.append(entry.path)
-                        
-                        # Search in file content even if filename doesn't match
-                        elif search_in_files and entry.is_file():
-                            found_lines = search_in_file(
-                                match_pattern.replace('*', ''), 
-                                entry.path
-                            )
-                            if found_lines:
-                                matches.append([entry.path, found_lines])
-                        
-                        # Recurse into directories
-                        if entry.is_dir(follow_symlinks=False):
-                            search(entry.path, current_depth + 1)
-                    
-                    except (OSError, PermissionError) as e:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError as e:
                         if DEBUG_MODE:
                             logger.warning(f"Error accessing {entry.path}: {e}")
-                        continue
-        
-        except (OSError, PermissionError) as e:
+                        is_dir = False
+                    
+                    yield entry, is_dir
+                    if is_dir and current_depth < max_depth:
+                        subdirs.append(entry.path)
+        except OSError as e:
             if DEBUG_MODE:
                 logger.warning(f"Error accessing directory {current_dir}: {e}")
-    
-    if {HAS_RICH or HAS_CTRACEBACK} and verbose:
-        with console.status(f"[bold green]Searching in:[/] [bold #FFFF00]{base_dir}[/]", spinner="point") as status:  # type: ignore
-            search(base_dir, 0)
-    return matches
+        
+        # Reversed so subdirectories are popped in listing order
+        stack.extend((path, current_depth + 1) for path in reversed(subdirs))
 
 def find_with_depth(base_dir, pattern, max_depth, include_dirs=True, 
                     case_insensitive=True, search_in_files=False, 
-                    include_pattern=''):
+                    include_pattern='', verbose=False):
     """
-    Search using Path.rglob() method.
+    Search by walking entries with os.scandir, pruned at max_depth.
     
     Args:
         base_dir: Starting directory
         pattern: Pattern to match (supports wildcards)
-        max_depth: Maximum depth to search
+        max_depth: Maximum search depth
         include_dirs: Whether to include directories in results
         case_insensitive: If True, match is case-insensitive
         search_in_files: If True, search for pattern inside files
         include_pattern: Only include files matching this pattern
+        verbose: Show a progress spinner while searching
         
     Returns:
-        list: List of matches (format same as fast_find)
+        generator: Matches as they are found (format same as fast_find)
     """
     # Validate inputs
     if not os.path.exists(base_dir):
@@ -363,97 +910,304 @@ def find_with_depth(base_dir, pattern, max_depth, include_dirs=True,
     include_patterns = parse_include_patterns(include_pattern, case_insensitive)
     if include_patterns:
         console.print(f"[bold cyan]Include patterns:[/] {include_patterns}")
+    include_re = compile_include_patterns(include_patterns, case_insensitive)
     
-    base = Path(base_dir)
-    matches = []
+    # Absolute base makes every entry.path absolute, no per-hit resolve()
+    base_dir = os.path.abspath(base_dir)
     is_wildcard = '*' in pattern or '?' in pattern
-    match_pattern = pattern.lower() if case_insensitive else pattern
+    content_pattern = pattern.replace('*', '')
     
-    try:
-        for p in base.rglob("*"):
+    name_match = compile_name_pattern(pattern, is_wildcard, case_insensitive)
+    
+    # Local aliases for the per-entry loop
+    include_match = include_re.match if include_re is not None else None
+    _search_in_file = search_in_file
+    
+    # The mode is fixed per call, so each gets its own loop
+    def search_names():
+        for entry, is_dir in _iter_entries(base_dir, max_depth):
+            name = entry.name
+            if name_match(name) is None:
+                continue
+            
+            if is_dir:
+                if include_dirs:
+                    yield entry.path
+                continue
+            
+            # DirEntry caches the type, so only a vanished entry raises here
             try:
-                relative_depth = len(p.relative_to(base).parts)
-                if relative_depth > max_depth:
-                    continue
-                
+                is_file = entry.is_file()
+            except OSError as e:
+                if DEBUG_MODE:
+                    logger.warning(f"Error accessing {entry.path}: {e}")
+                continue
+            
+            if is_file:
                 # Skip files not matching include pattern
-                if p.is_file() and not matches_include_pattern(
-                    p.name, include_patterns, case_insensitive
-                ):
+                if include_match is None or include_match(name) is not None:
+                    yield entry.path
+            elif include_dirs:
+                yield entry.path
+    
+    def search_content():
+        for entry, is_dir in _iter_entries(base_dir, max_depth):
+            # The walker already knows directories, which are never files
+            if is_dir:
+                continue
+            try:
+                if not entry.is_file():
                     continue
+            except OSError as e:
+                if DEBUG_MODE:
+                    logger.warning(f"Error accessing {entry.path}: {e}")
+                continue
+            
+            # Skip files not matching include pattern
+            if include_match is not None and include_match(entry.name) is None:
+                continue
+            
+            # Every included file is searched, whatever its name
+            # (search_in_file handles its own I/O errors)
+            path = entry.path
+            found_lines = _search_in_file(
+                content_pattern, path, case_insensitive=case_insensitive
+            )
+            if found_lines:
+                yield [path, found_lines]
+    
+    def run():
+        search = search_content if search_in_files else search_names
+        if HAS_RICH and verbose:
+            with console.status(f"[bold green]Searching in:[/] [bold #FFFF00]{base_dir}[/]", spinner="point"):  # type: ignore
+                yield from search()
+        else:
+            yield from search()
+    
+    return run()
+
+def walk_find(base_dir, pattern, max_depth, include_dirs=True, 
+              case_insensitive=False, search_in_files=False, 
+              include_pattern='', verbose=False):
+    """
+    Search using os.walk(), pruning directories in place at max_depth.
+    
+    Args:
+        base_dir: Starting directory
+        pattern: Pattern to match (supports wildcards)
+        max_depth: Maximum depth to search (0 = current dir only)
+        include_dirs: Whether to include directories in results
+        case_insensitive: If True, match is case-insensitive
+        search_in_files: If True, search for pattern inside files
+        include_pattern: Only include files matching this pattern
+        verbose: Show a progress spinner while searching
+        
+    Returns:
+        generator: Matches as they are found (format same as fast_find)
+    """
+    # Validate inputs
+    if not os.path.exists(base_dir):
+        raise SearchError(f"Directory does not exist: {base_dir}")
+    
+    if not os.path.isdir(base_dir):
+        raise SearchError(f"Not a directory: {base_dir}")
+    
+    if max_depth < 0:
+        raise SearchError(f"max_depth must be >= 0, got: {max_depth}")
+    
+    if search_in_files:
+        include_dirs = False
+    logger.debug(f"include_dirs: {include_dirs}")
+    
+    # Parse include patterns
+    include_patterns = parse_include_patterns(include_pattern, case_insensitive)
+    if include_patterns:
+        console.print(f"[bold cyan]Include patterns:[/] {include_patterns}")
+    include_re = compile_include_patterns(include_patterns, case_insensitive)
+    
+    base_dir = os.path.normpath(base_dir)
+    # Separators in base_dir, not counting the one a root path ends with
+    base_seps = base_dir.count(os.sep) - base_dir.endswith(os.sep)
+    is_wildcard = '*' in pattern or '?' in pattern
+    content_pattern = pattern.replace('*', '')
+    
+    name_match = compile_name_pattern(pattern, is_wildcard, case_insensitive)
+    
+    # Local aliases for the per-entry loop
+    include_match = include_re.match if include_re is not None else None
+    _search_in_file = search_in_file
+    _join = os.path.join
+    _isfile = os.path.isfile
+    sep = os.sep
+    
+    def on_error(e):
+        if DEBUG_MODE:
+            logger.warning(f"Error accessing directory {e.filename}: {e}")
+    
+    def search():
+        for root, dirs, files in os.walk(base_dir, onerror=on_error, followlinks=False):
+            depth = 0 if root == base_dir else root.count(sep) - base_seps
+            
+            if include_dirs:
+                for name in dirs:
+                    if name_match(name) is not None:
+                        yield _join(root, name)
+            
+            # Separate loops keep the mode check out of the per-file path;
+            # os.walk lists FIFOs, sockets and dangling symlinks as files
+            # too, so each loop re-checks for a regular file like fast_find
+            if search_in_files:
+                if include_match is not None:
+                    # Skip files not matching include pattern
+                    files = [name for name in files if include_match(name) is not None]
                 
-                name_to_match = p.name.lower() if case_insensitive else p.name
-                
-                # Check if matches pattern
-                is_match = False
-                if is_wildcard:
-                    is_match = fnmatch.fnmatch(name_to_match, match_pattern)
-                else:
-                    is_match = match_pattern in name_to_match
-                
-                # Process matches
-                if is_match and (include_dirs or p.is_file()):
-                    if search_in_files and p.is_file():
-                        found_lines = search_in_file(
-                            match_pattern.replace('*', ''), 
-                            str(p.resolve())
-                        )
-                        if found_lines:
-                            matches.append([str(p.resolve()), found_lines])
-                    else:
-                        matches.append(str(p.resolve()))
-                
-                # Search in file content even if filename doesn't match
-                elif search_in_files and p.is_file():
-                    found_lines = search_in_file(
-                        match_pattern.replace('*', ''), 
-                        str(p.resolve())
+                for name in files:
+                    path = _join(root, name)
+                    if not _isfile(path):
+                        continue
+                    found_lines = _search_in_file(
+                        content_pattern, path, case_insensitive=case_insensitive
                     )
                     if found_lines:
-                        matches.append([str(p.resolve()), found_lines])
+                        yield [path, found_lines]
+            else:
+                for name in files:
+                    if name_match(name) is None:
+                        continue
+                    path = _join(root, name)
+                    if _isfile(path):
+                        # Include patterns only apply to regular files
+                        if include_match is None or include_match(name) is not None:
+                            yield path
+                    elif include_dirs:
+                        # Other entries are reported like directories
+                        yield path
             
-            except (OSError, PermissionError) as e:
-                if DEBUG_MODE:
-                    logger.warning(f"Error accessing {p}: {e}")
-                continue
+            # Prune in place so os.walk never lists directories past max_depth
+            if depth >= max_depth:
+                dirs[:] = []
     
-    except Exception as e:
-        if DEBUG_MODE:
-            logger.error(f"Error during search: {e}")
+    def run():
+        if HAS_RICH and verbose:
+            with console.status(f"[bold green]Searching in:[/] [bold #FFFF00]{base_dir}[/]", spinner="point"):  # type: ignore
+                yield from search()
+        else:
+            yield from search()
     
-    return matches
+    return run()
 
 def format_output(data, search_in_files=False):
     """
-    Format and print search results.
+    Format and print search results as they arrive.
+    
+    Lines are buffered and written in batches, so console work does not
+    happen once per result. The first result after a quiet spell is
+    written at once, and a timer thread writes anything that has been
+    buffered for OUTPUT_FLUSH_INTERVAL while the search is still busy.
+    The search itself runs on the calling thread. With Rich, styled Text
+    is built directly, so no markup is parsed and file content needs no
+    escaping. The total is printed at the end.
     
     Args:
-        data: Search results
+        data: Iterable of search results
         search_in_files: Whether results include file content
     """
-    if not data:
-        console.print("\n[yellow]No results found[/]\n")
-        return
+    styles = (STYLE_INDEX, STYLE_PATH, STYLE_LINE_NUM, STYLE_LINE)
+    if HAS_RICH:
+        from rich.style import Style
+        from rich.text import Text
+        index_style, path_style, num_style, line_style = map(Style.parse, styles)
+    else:
+        from make_colors import make_colors  # type: ignore
+        index_style, path_style, num_style, line_style = styles
+        
+        def render_plain(part, style):
+            """Color one segment with make_colors, keeping file content literal."""
+            if style is None or not part:
+                return part
+            if style is line_style:
+                # make_colors parses markup in any string holding "[/", so
+                # such content is printed uncolored rather than reinterpreted
+                return part if '[/' in part else make_colors(part, 'lc')
+            return make_colors(f"[{style}]{part}[/]")
     
-    console.print(f"\n[white on red]FOUND:[/] [black on #00FFFF]{len(data)}[/]\n")
+    # Buffered lines, each a tuple of (text, style) segments; shared with
+    # the timer thread, so only touched while holding lock
+    buf = []
+    lock = threading.Lock()
+    # The first result is written as soon as it arrives
+    last_flush = float('-inf')
     
-    zfill = len(str(len(data)))
-    for index, item in enumerate(data, 1):
-        if DEBUG_MODE:
-            debug(index=index, item=item)
-        
-        if search_in_files and isinstance(item, (list, tuple)) and len(item) >= 2:
-            # Format: [filepath, [(line_num, line_text), ...]]
-            filepath = item[0]
-            console.print(f"[bold #FFAAFF]{str(index).zfill(zfill)}[/]. [bold #FFFF00]{filepath}[/]")
+    def flush():
+        nonlocal last_flush
+        if buf:
+            last_flush = time.monotonic()
+            if HAS_RICH:
+                text = Text()
+                append = text.append
+                for i, segments in enumerate(buf):
+                    if i:
+                        append('\n')
+                    for part, style in segments:
+                        append(part, style)
+                console.print(text)
+            else:
+                print('\n'.join(
+                    ''.join(render_plain(part, style) for part, style in segments)
+                    for segments in buf
+                ))
+            buf.clear()
+    
+    stop = threading.Event()
+    
+    def flush_timer():
+        # Writes lines that arrived just after a flush while the search
+        # is busy finding the next one
+        while not stop.wait(OUTPUT_FLUSH_INTERVAL):
+            with lock:
+                flush()
+    
+    timer = threading.Thread(target=flush_timer, daemon=True)
+    timer.start()
+    
+    count = 0
+    try:
+        for index, item in enumerate(data, 1):
+            count = index
+            if DEBUG_MODE:
+                debug(index=index, item=item)
             
-            matches = item[1]
-            for line_num, line_text in matches:
-                console.print(f"  [white on red]{line_num + 1}[/]. [bold red]", end='')
-                print(make_colors(line_text.rstrip(), 'lc'))
-        else:
-            # Simple filepath
-            console.print(f"[bold #FFAAFF]{str(index).zfill(zfill)}[/]. [bold #FFFF00]{item}[/]")
+            lines = [()] if index == 1 else []
+            if search_in_files and isinstance(item, (list, tuple)) and len(item) >= 2:
+                # Format: [filepath, [(line_num, line_text), ...]]
+                filepath = item[0]
+                lines.append(((str(index), index_style), ('. ', None), (filepath, path_style)))
+                
+                matches = item[1]
+                for line_num, line_text in matches:
+                    lines.append((
+                        ('  ', None), (str(line_num + 1), num_style), ('. ', None),
+                        (line_text.rstrip(), line_style),
+                    ))
+            else:
+                # Simple filepath
+                lines.append(((str(index), index_style), ('. ', None), (item, path_style)))
+            
+            with lock:
+                buf.extend(lines)
+                if len(buf) >= OUTPUT_BATCH_LINES or time.monotonic() - last_flush >= OUTPUT_FLUSH_INTERVAL:
+                    flush()
+    finally:
+        stop.set()
+        timer.join()
+    
+    flush()
+    
+    if not count:
+        console.print("\n[yellow]No results found[/]\n")
+        return
+    
+    console.print(f"\n[white on red]FOUND:[/] [black on #00FFFF]{count}[/]\n")
 
 def get_version():
     try:
@@ -475,6 +1229,12 @@ def get_version():
 
 def main():
     """Main entry point"""
+    import argparse
+    try:
+        from licface import CustomRichHelpFormatter
+    except ImportError:
+        CustomRichHelpFormatter = argparse.RawTextHelpFormatter
+    
     parser = argparse.ArgumentParser(
         formatter_class=CustomRichHelpFormatter, 
         prog='fsearch',
@@ -482,8 +1242,8 @@ def main():
     )
     
     parser.add_argument('SEARCH', help="Pattern to search for")
-    parser.add_argument('-m', '--method', type=int, choices=[1, 2], default=1,
-                        help='Search method: 1=scandir (faster), 2=rglob')
+    parser.add_argument('-m', '--method', type=int, choices=[1, 2, 3], default=1,
+                        help='Search method: 1=scandir (faster), 2=depth-pruned walk, 3=os.walk')
     parser.add_argument('-c', '--case-insensitive', action='store_true', default=True,
                         help='Enable case-insensitive search (default: True)')
     parser.add_argument('-C', '--case-sensitive', action='store_true',
@@ -500,6 +1260,8 @@ def main():
                         help='Search for text inside files')
     parser.add_argument('-i', '--include', default='',
                         help='Only include files matching pattern (e.g., "*.py,*.txt")')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of threads scanning directories, method 1 only (0 = automatic, default: 1)')
     parser.add_argument('-v', '--verbose', action='store_true',
                         help='Enable verbose output')
     parser.add_argument('-V', '--version', action='store_true',
@@ -535,9 +1297,21 @@ def main():
         console.print(f"[bold red]Error:[/] Not a directory: {args.path}")
         return 1
     
+    # Validate jobs
+    if args.jobs < 0:
+        console.print("[bold red]Error:[/] --jobs must be >= 0")
+        return 1
+    
+    if args.jobs != 1 and args.method != 1:
+        console.print("[bold red]Error:[/] --jobs is only supported with --method 1")
+        return 1
+    
     try:
         # Perform search
-        search_func = fast_find if args.method == 1 else find_with_depth
+        search_func = {1: fast_find, 2: find_with_depth, 3: walk_find}[args.method]
+        search_kwargs = {}
+        if args.method == 1:
+            search_kwargs['workers'] = args.jobs
         
         data = search_func(
             base_dir=args.path,
@@ -548,6 +1322,7 @@ def main():
             search_in_files=args.file,
             include_pattern=args.include,
             verbose=args.verbose,  # type: ignore
+            **search_kwargs,
         )
         
         # Display results